@@ -28,8 +28,8 @@ import asyncio
 from yaspeedtest.client import YaSpeedTest
 
 async def main():
-    ya = await YaSpeedTest().create()
-    result = await ya.run()
+    async with await YaSpeedTest.create() as ya:
+        result = await ya.run()
     print(f"Ping: {result.ping_ms:.2f} ms")
     print(f"Download: {result.download_mbps:.2f} Mbps")
     print(f"Upload: {result.upload_mbps:.2f} Mbps")
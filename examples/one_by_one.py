@@ -45,6 +45,9 @@ Notes
 - This version uses `YaSpeedTest.measure_download_peak()` and `YaSpeedTest.measure_upload_peak()`,
   which provide more realistic speed values closer to the official
   Yandex Internet Speed Test.
+- All probes run concurrently, so the latency figures are measured while
+  the link is loaded (useful for spotting bufferbloat) and the total run
+  time is close to the slowest probe rather than the sum of all phases.
 - Intended for testing, diagnostics, and API integration scenarios.
 """
 
@@ -52,6 +55,18 @@ import asyncio
 from yaspeedtest.client import YaSpeedTest
 from yaspeedtest.types import ProbeModel, ProbesResponse
 
+async def download_task(client: YaSpeedTest, p: ProbeModel):
+    mbps = await client.measure_download_peak(p.url, p.timeout)
+    print(f"[Download] {mbps:.2f} Mbps")
+
+async def upload_task(client: YaSpeedTest, p: ProbeModel):
+    mbps = await client.measure_upload_peak(p.url, p.size, p.timeout)
+    print(f"[Upload] {mbps:.2f} Mbps")
+
+async def latency_task(client: YaSpeedTest, p: ProbeModel):
+    ms = await client.measure_latency(p.url, p.timeout)
+    print(f"[Latency] {ms:.2f} ms")
+
 async def main():
     yaSpeedTestClinet = await YaSpeedTest.create()
     probes:ProbesResponse = yaSpeedTestClinet.probes
@@ -65,34 +80,14 @@ async def main():
         print(f"[Latency] {probe.url}")
     print()
 
-    # --- Download ---
-    download_tasks = []
-    for probe in probes.download.probes:
-        async def download_task(p:ProbeModel=probe):
-            mbps = await yaSpeedTestClinet.measure_download_peak(p.url, p.timeout)
-            print(f"[Download] {mbps:.2f} Mbps")
-        download_tasks.append(download_task())
-    await asyncio.gather(*download_tasks)
-
-    # --- Upload ---
-    upload_tasks = []
-    for probe in probes.upload.probes:
-        async def upload_task(p:ProbeModel=probe):
-            mbps = await yaSpeedTestClinet.measure_upload_peak(p.url, p.size, p.timeout)
-            print(f"[Upload] {mbps:.2f} Mbps")
-        upload_tasks.append(upload_task())
-    await asyncio.gather(*upload_tasks)
-
-    # --- Latency ---
-    latency_tasks = []
-    for probe in probes.latency.probes:
-        async def latency_task(p:ProbeModel=probe):
-            ms = await yaSpeedTestClinet.measure_latency(p.url, p.timeout)
-            print(f"[Latency] {ms:.2f} ms")
-        latency_tasks.append(latency_task())
-    await asyncio.gather(*latency_tasks)
-    print()
+    download_tasks = [download_task(yaSpeedTestClinet, p) for p in probes.download.probes]
+    upload_tasks = [upload_task(yaSpeedTestClinet, p) for p in probes.upload.probes]
+    latency_tasks = [latency_task(yaSpeedTestClinet, p) for p in probes.latency.probes]
 
+    # --- Run all probes concurrently ---
+    await asyncio.gather(*download_tasks, *latency_tasks, *upload_tasks)
+    print()
+    await yaSpeedTestClinet.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -1,4 +1,6 @@
 import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 from yaspeedtest.client import YaSpeedTest
 
 @pytest_asyncio.fixture
@@ -7,4 +9,23 @@ async def ya_client():
     Create YaSpeedTest client with mocked probes
     """
     client = await YaSpeedTest.create()
-    return client
\ No newline at end of file
+    yield client
+    await client.close()
+
+@pytest_asyncio.fixture
+async def local_server():
+    """
+    Start local aiohttp servers for offline tests; returns a `start(app)` factory.
+    """
+    servers = []
+
+    async def start(app: web.Application) -> TestServer:
+        server = TestServer(app)
+        await server.start_server()
+        servers.append(server)
+        return server
+
+    yield start
+
+    for server in servers:
+        await server.close()
@@ -1,9 +1,79 @@
 import pytest
+from aiohttp import web
 from yaspeedtest.client import YaSpeedTest
+from yaspeedtest.types import YandexAPIError
 
 @pytest.mark.asyncio
 async def test_client_creation():
     client = await YaSpeedTest.create()
     assert client is not None
     assert isinstance(client.DEFAULT_HEADERS, dict)
-    assert client.base_url.startswith("https://")
\ No newline at end of file
+    assert client.base_url.startswith("https://")
+    await client.close()
+
+@pytest.mark.asyncio
+async def test_close_closes_session():
+    client = YaSpeedTest()
+    session = client._get_session()
+    await client.close()
+    assert session.closed
+
+@pytest.mark.asyncio
+async def test_context_manager_opens_and_closes_session():
+    async with YaSpeedTest() as client:
+        session = client._session
+        assert session is not None and not session.closed
+    assert session.closed
+
+@pytest.mark.asyncio
+async def test_create_closes_session_when_start_fails(monkeypatch, local_server):
+    async def probes(request):
+        return web.Response(status=500, text="boom")
+
+    app = web.Application()
+    app.router.add_get("/internet/api/v0/get-probes", probes)
+    server = await local_server(app)
+
+    created = []
+    start_process = YaSpeedTest._start_process
+
+    async def spy(self):
+        created.append(self)
+        self.base_url = str(server.make_url("")).rstrip("/")
+        await start_process(self)
+
+    monkeypatch.setattr(YaSpeedTest, "_start_process", spy)
+
+    with pytest.raises(YandexAPIError):
+        await YaSpeedTest.create()
+
+    assert created[0]._session.closed
+
+@pytest.mark.asyncio
+async def test_measure_without_create_uses_lazy_session(local_server):
+    async def download(request):
+        return web.Response(body=b"x" * 1000)
+
+    app = web.Application()
+    app.router.add_get("/100kb", download)
+    server = await local_server(app)
+
+    async with YaSpeedTest() as client:
+        secs, nbytes = await client.measure_download(str(server.make_url("/100kb")))
+
+    assert nbytes == 1000
+    assert secs != float("inf")
+
+@pytest.mark.asyncio
+async def test_measure_after_close_raises():
+    client = YaSpeedTest()
+    client._get_session()
+    await client.close()
+
+    url = "http://127.0.0.1:1/probe"
+    with pytest.raises(RuntimeError):
+        await client.measure_download(url)
+    with pytest.raises(RuntimeError):
+        await client.measure_latency(url)
+    with pytest.raises(RuntimeError):
+        await client.measure_download_peak(url)
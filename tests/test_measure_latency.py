@@ -0,0 +1,171 @@
+import asyncio
+import pytest
+from aiohttp import web
+from yaspeedtest.client import YaSpeedTest, _median_sorted
+from yaspeedtest.types import ProbesResponse, ProbesList, ProbeModel
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [
+        ([7], 7),
+        ([1, 2, 9], 2),
+        ([1.5, 2.5, 3.5, 10.0, 20.0], 3.5),
+        ([1, 4], 2.5),
+        ([1_000_000, 2_000_000, 3_000_000, 5_000_000], 2_500_000),
+        ([0.5, 1.0, 2.0, 8.0], 1.5),
+    ],
+)
+def test_median_sorted(values, expected):
+    assert _median_sorted(values) == expected
+
+@pytest.mark.asyncio
+async def test_latency_is_trimmed_median(local_server):
+    """
+    Five concurrent attempts served with 100..400 ms delays plus one 900 ms outlier:
+    the outlier is trimmed and the median of the rest (250 ms) is reported.
+    """
+    delays = iter([0.1, 0.2, 0.3, 0.4, 0.9])
+
+    async def ping(request):
+        await asyncio.sleep(next(delays))
+        return web.Response(body=b"pong")
+
+    app = web.Application()
+    app.router.add_get("/ping", ping)
+    server = await local_server(app)
+
+    async with YaSpeedTest() as client:
+        ms = await client.measure_latency(str(server.make_url("/ping")), attempts=5, warmup=0)
+
+    assert 250 <= ms < 290
+
+@pytest.mark.asyncio
+async def test_latency_falls_back_to_ranged_get(local_server):
+    """
+    HEAD rejected with 405 must be retried as a single-byte ranged GET.
+    """
+    ranges = []
+
+    async def ping(request):
+        ranges.append(request.headers.get("Range"))
+        return web.Response(body=b"p")
+
+    app = web.Application()
+    app.router.add_get("/ping", ping, allow_head=False)
+    server = await local_server(app)
+
+    async with YaSpeedTest() as client:
+        ms = await client.measure_latency(str(server.make_url("/ping")), attempts=3)
+
+    assert 0 <= ms < 10_000
+    assert ranges and all(r == "bytes=0-0" for r in ranges)
+
+@pytest.mark.asyncio
+async def test_latency_does_not_follow_redirects(local_server):
+    followed = []
+
+    async def ping(request):
+        raise web.HTTPFound("/target")
+
+    async def target(request):
+        followed.append(request.method)
+        return web.Response()
+
+    app = web.Application()
+    app.router.add_route("HEAD", "/ping", ping)
+    app.router.add_route("*", "/target", target)
+    server = await local_server(app)
+
+    async with YaSpeedTest() as client:
+        ms = await client.measure_latency(str(server.make_url("/ping")), attempts=3)
+
+    assert 0 <= ms < 10_000
+    assert followed == []
+
+@pytest.mark.asyncio
+async def test_latency_reuses_warmed_connection(local_server):
+    peers = []
+
+    async def ping(request):
+        peers.append(request.transport.get_extra_info("peername"))
+        return web.Response(body=b"pong")
+
+    app = web.Application()
+    app.router.add_get("/ping", ping)
+    server = await local_server(app)
+    url = str(server.make_url("/ping"))
+
+    async with YaSpeedTest() as client:
+        client.probes = ProbesResponse(
+            mid="mid", lid=["lid"], perfLog="",
+            latency=ProbesList(probes=[ProbeModel(url=url)]),
+            download=ProbesList(probes=[]),
+            upload=ProbesList(probes=[]),
+        )
+        await client._warmup_probe_hosts()
+        await client.measure_latency(url, attempts=1, warmup=0)
+
+    assert len(peers) == 2
+    assert peers[0] == peers[1]
+
+@pytest.mark.asyncio
+async def test_latency_fallback_ignoring_range_does_not_download_body(local_server):
+    """
+    A server that rejects HEAD and ignores `Range` must not have its body downloaded.
+    """
+    methods = []
+    completed = []
+
+    @web.middleware
+    async def record(request, handler):
+        methods.append(request.method)
+        return await handler(request)
+
+    async def big(request):
+        resp = web.StreamResponse()
+        resp.content_length = 64 * 1024 * 1024
+        await resp.prepare(request)
+        chunk = bytes(64 * 1024)
+        try:
+            for _ in range(1024):
+                await resp.write(chunk)
+        except ConnectionError:
+            return resp
+        completed.append(True)
+        return resp
+
+    app = web.Application(middlewares=[record])
+    app.router.add_get("/big", big, allow_head=False)
+    server = await local_server(app)
+
+    async with YaSpeedTest() as client:
+        ms = await client.measure_latency(str(server.make_url("/big")), attempts=3)
+        ms_again = await client.measure_latency(str(server.make_url("/big")), attempts=3)
+
+    assert 0 <= ms < 10_000 and 0 <= ms_again < 10_000
+    assert completed == []
+    # HEAD is only tried until the first 405 is seen for the host
+    assert methods.count("HEAD") <= 3
+    assert methods.count("GET") == 12
+
+@pytest.mark.asyncio
+async def test_latency_fallback_does_not_follow_redirects(local_server):
+    followed = []
+
+    async def ping(request):
+        raise web.HTTPFound("/target")
+
+    async def target(request):
+        followed.append(request.method)
+        return web.Response()
+
+    app = web.Application()
+    app.router.add_get("/ping", ping, allow_head=False)
+    app.router.add_route("*", "/target", target)
+    server = await local_server(app)
+
+    async with YaSpeedTest() as client:
+        ms = await client.measure_latency(str(server.make_url("/ping")), attempts=3)
+
+    assert 0 <= ms < 10_000
+    assert followed == []
@@ -0,0 +1,173 @@
+from urllib.parse import urlsplit
+import pytest
+from aiohttp import web
+from yaspeedtest.client import YaSpeedTest, _client_timeout, _subtract_baseline
+from yaspeedtest.types import ProbesResponse, ProbesList, ProbeModel
+
+async def _start(local_server, received=None):
+    """
+    Serve `/ok` (4096-byte body) and `/fail` (500); request body sizes on `/ok`
+    are appended to `received`.
+    """
+    async def ok(request):
+        body = await request.read()
+        if received is not None and request.method == "POST":
+            received.append(len(body))
+        return web.Response(body=b"x" * 4096)
+
+    async def fail(request):
+        await request.read()
+        return web.Response(status=500, text="boom")
+
+    app = web.Application(client_max_size=64 * 1024 * 1024)
+    app.router.add_route("*", "/ok", ok)
+    app.router.add_route("*", "/fail", fail)
+    return await local_server(app)
+
+@pytest.mark.asyncio
+async def test_timed_request_returns_reader_byte_count(local_server):
+    server = await _start(local_server)
+
+    async def reader(resp):
+        return len(await resp.read())
+
+    async with YaSpeedTest() as client:
+        secs, nbytes = await client._timed_request(
+            "GET", str(server.make_url("/ok")), _client_timeout(5), reader
+        )
+
+    assert nbytes == 4096
+    assert 0 < secs < float("inf")
+
+@pytest.mark.asyncio
+async def test_timed_request_error_status_is_failure(local_server):
+    server = await _start(local_server)
+    calls = []
+
+    async def reader(resp):
+        calls.append(resp.status)
+        return 1
+
+    async with YaSpeedTest() as client:
+        result = await client._timed_request(
+            "GET", str(server.make_url("/fail")), _client_timeout(5), reader
+        )
+
+    assert result == (float("inf"), 0)
+    assert calls == []
+
+@pytest.mark.asyncio
+async def test_measure_download_and_upload_byte_counts(local_server):
+    received = []
+    server = await _start(local_server, received)
+
+    async with YaSpeedTest() as client:
+        _, downloaded = await client.measure_download(str(server.make_url("/ok")))
+        _, uploaded = await client.measure_upload(str(server.make_url("/ok")), 10_000)
+        assert await client.measure_download(str(server.make_url("/fail"))) == (float("inf"), 0)
+        assert await client.measure_upload(str(server.make_url("/fail")), 10_000) == (float("inf"), 0)
+
+    assert downloaded == 4096
+    assert uploaded == 10_000
+    assert received == [10_000]
+
+@pytest.mark.asyncio
+async def test_measure_upload_streams_large_payload(local_server):
+    """
+    Payloads above the shared 8 MB zero block are streamed as repeated views of it
+    plus a partial tail.
+    """
+    received = []
+    server = await _start(local_server, received)
+    size = 2 * 8 * 1024 * 1024 + 12_345
+
+    async with YaSpeedTest() as client:
+        secs, uploaded = await client.measure_upload(str(server.make_url("/ok")), size)
+
+    assert secs != float("inf")
+    assert uploaded == size
+    assert received == [size]
+
+@pytest.mark.asyncio
+async def test_baseline_rtt_is_lazy_and_cached_per_host(local_server):
+    heads = []
+
+    async def ok(request):
+        if request.method == "HEAD":
+            heads.append(request.path)
+        return web.Response(body=b"x" * 4096)
+
+    app = web.Application()
+    app.router.add_get("/ok", ok)
+    server = await local_server(app)
+
+    async with YaSpeedTest() as client:
+        assert client._baseline_rtt_s == {}
+        await client.measure_download(str(server.make_url("/ok")))
+        pinged = len(heads)
+        await client.measure_download(str(server.make_url("/ok")))
+
+    assert pinged > 0
+    assert len(heads) == pinged
+
+@pytest.mark.parametrize(
+    "elapsed, baseline, expected",
+    [
+        (0.5, 0.0, 0.5),
+        (0.005, 0.005, 0.005),
+        (0.019, 0.005, 0.019),
+        (0.020, 0.005, 0.015),
+        (1.0, 0.010, 0.990),
+        (float("inf"), 0.010, float("inf")),
+    ],
+)
+def test_subtract_baseline(elapsed, baseline, expected):
+    assert _subtract_baseline(elapsed, baseline) == pytest.approx(expected)
+
+@pytest.mark.asyncio
+async def test_short_transfer_is_not_adjusted(local_server):
+    server = await _start(local_server)
+    url = str(server.make_url("/ok"))
+
+    async with YaSpeedTest() as client:
+        # A baseline far larger than the transfer must leave the duration as measured
+        client._baseline_rtt_s[urlsplit(url).netloc] = 10.0
+        secs, nbytes = await client.measure_download(url)
+
+    assert nbytes == 4096
+    assert 0 < secs < 10.0
+
+@pytest.mark.asyncio
+async def test_create_measures_baseline_before_transfers(monkeypatch, local_server):
+    heads = []
+
+    async def ok(request):
+        if request.method == "HEAD":
+            heads.append(request.path)
+        return web.Response(body=b"x" * 4096)
+
+    app = web.Application()
+    app.router.add_get("/ok", ok)
+    app.router.add_post("/ok", ok)
+    server = await local_server(app)
+    url = str(server.make_url("/ok"))
+
+    async def start_process(self):
+        probe = ProbeModel(url=url, timeout=5, size=1000)
+        self.probes = ProbesResponse(
+            mid="mid", lid=["lid"], perfLog="",
+            latency=ProbesList(probes=[]),
+            download=ProbesList(probes=[probe]),
+            upload=ProbesList(probes=[probe]),
+        )
+
+    monkeypatch.setattr(YaSpeedTest, "_start_process", start_process)
+
+    async with await YaSpeedTest.create() as client:
+        assert urlsplit(url).netloc in client._baseline_rtt_s
+        pinged = len(heads)
+        await client.measure_download(url)
+        await client.measure_upload(url, 1000)
+
+    assert pinged > 0
+    assert len(heads) == pinged
@@ -1,8 +1,21 @@
 """yainternet package
 Public API: YaSpeedTest
 """
-from yaspeedtest.client import YaSpeedTest
-from .types import SpeedResult, ProbeModel, ProbesResponse
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from yaspeedtest.client import YaSpeedTest
+    from .types import SpeedResult, ProbeModel, ProbesResponse
 
 __all__ = ["YaSpeedTest", "SpeedResult", "ProbeModel", "ProbesResponse"]
-__author__ = "Erilov Nikita"
\ No newline at end of file
+__author__ = "Erilov Nikita"
+
+def __getattr__(name: str):
+    # Lazy exports keep `import yaspeedtest.cli` from loading aiohttp/pydantic up front
+    if name == "YaSpeedTest":
+        from yaspeedtest.client import YaSpeedTest
+        return YaSpeedTest
+    if name in ("SpeedResult", "ProbeModel", "ProbesResponse"):
+        from . import types
+        return getattr(types, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
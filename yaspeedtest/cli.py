@@ -1,7 +1,9 @@
 import asyncio
 import argparse
-from yaspeedtest.client import YaSpeedTest
-from yaspeedtest.types import SpeedResult
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from yaspeedtest.types import SpeedResult
 
 async def run_cli(count: int = 1, json_output: bool = False):
     """
@@ -21,8 +23,11 @@ async def run_cli(count: int = 1, json_output: bool = False):
         Exception: Any unhandled exceptions are propagated up the stack. It is recommended to use external handlers when embedding the CLI in other processes.
     """
 
-    ya = await YaSpeedTest.create()
-    result:SpeedResult = await ya.run(count)
+    # Imported here so that `--help` and argument errors don't pay for aiohttp/pydantic
+    from yaspeedtest.client import YaSpeedTest
+
+    async with await YaSpeedTest.create() as ya:
+        result: "SpeedResult" = await ya.run(count)
 
     if json_output:
         import json
@@ -53,7 +58,8 @@ def main():
 
     Behavior:
         - Parses parameters and generates an `args` object.
-        - Runs the asynchronous `run_cli()` function via `asyncio.run`.
+        - Runs the asynchronous `run_cli()` function in an `asyncio.Runner`,
+        using the `uvloop` event loop when it is installed.
         - Provides a standard user experience for installing via pip and invoking
         the `yaspeedtest` command in the terminal.
     """
@@ -65,4 +71,12 @@ def main():
                         help="Return JSON format")
 
     args = parser.parse_args()
-    asyncio.run(run_cli(args.count, args.json))
\ No newline at end of file
+
+    try:
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(run_cli(args.count, args.json))
\ No newline at end of file
@@ -1,13 +1,50 @@
 import time
-import statistics
 import asyncio
 import aiohttp
-from typing import Tuple, Deque
+from functools import lru_cache
+from urllib.parse import urlsplit
+from typing import Tuple, Deque, Callable, Awaitable
 from collections import deque
 from aiohttp.client_exceptions import ClientConnectorError
 
 from yaspeedtest.types import YandexAPIError, ProbesResponse, SpeedResult, ProbeModel
 
+# Shared zero block for uploads: smaller payloads are posted as a view of it,
+# larger ones are streamed as repeated views, so no upload allocates its own buffer
+_ZERO_BUFFER = bytes(8 * 1024 * 1024)
+# Shared zero chunk for sampled (peak) uploads
+_PEAK_CHUNK = bytes(64 * 1024)
+# Response buffer high-water mark for downloads; aiohttp pauses the socket above it
+_DOWNLOAD_READ_BUFSIZE = 1 << 20
+
+# Transfers shorter than this many baseline RTTs are reported unadjusted
+_MIN_RTTS_FOR_ADJUSTMENT = 4
+
+def _subtract_baseline(elapsed: float, baseline: float) -> float:
+    """
+    Remove one request round trip from a transfer duration.
+
+    The request RTT is only separable from transfer time when the transfer spans
+    several round trips; shorter transfers are dominated by TCP slow start, so
+    subtracting would overstate throughput. Those are returned as measured, which
+    also bounds the adjustment to 1 / `_MIN_RTTS_FOR_ADJUSTMENT` of the duration.
+    """
+    if baseline <= 0 or elapsed < _MIN_RTTS_FOR_ADJUSTMENT * baseline:
+        return elapsed
+    return elapsed - baseline
+
+def _median_sorted(values: list) -> float:
+    """Return the median of an already sorted, non-empty list."""
+    mid = len(values) // 2
+    if len(values) % 2:
+        return values[mid]
+    return (values[mid - 1] + values[mid]) / 2
+
+@lru_cache(maxsize=32)
+def _client_timeout(total: float | None, connect: float | None = None, sock_read: float | None = None) -> aiohttp.ClientTimeout:
+    """Return a shared `aiohttp.ClientTimeout` for the given limits."""
+    return aiohttp.ClientTimeout(total=total, connect=connect, sock_read=sock_read)
+
 class YaSpeedTest:
     DEFAULT_HEADERS = {
         "User-Agent": "Mozilla/5.0 (Windows NT 6.1; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/86.0.4240.198 Safari/537.36 OPR/72.0.3815.459",
@@ -20,22 +57,71 @@ class YaSpeedTest:
         "sec-fetch-site" : "cross-site"
     }
     
-    def __init__(self):
+    def __init__(self, max_concurrency: int = 16):
         """
         Initialize the Yandex Speedtest client.
+
+        Parameters:
+            `max_concurrency` (int): Maximum number of probe requests in flight at once. Default: 16.
         """
         self.base_url: str = "https://yandex.ru".rstrip("/")
         self.headers: dict = self.DEFAULT_HEADERS.copy()
         self.probes: ProbesResponse = None
         self.mid: str = None
         self.lid: str = None
+        self._connector: aiohttp.TCPConnector = None
+        self._session: aiohttp.ClientSession = None
+        self._sem: asyncio.Semaphore = asyncio.Semaphore(max_concurrency)
+        self._baseline_rtt_s: dict[str, float] = {}
+        self._baseline_locks: dict[str, asyncio.Lock] = {}
+        self._head_rejected_hosts: set[str] = set()
     
     @classmethod
-    async def create(cls):
-        self = cls()
-        await self.__start_proccess()
+    async def create(cls, max_concurrency: int = 16):
+        self = cls(max_concurrency)
+        try:
+            await self._start_process()
+            await self._warmup_probe_hosts()
+            await self._measure_baseline_rtts()
+        except BaseException:
+            await self.close()
+            raise
         return self
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared HTTP session, creating it on first use.
+
+        Raises:
+            RuntimeError: If the client has already been closed.
+        """
+        if self._session is None:
+            self._connector = aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=19,
+                ttl_dns_cache=300,
+                use_dns_cache=True,
+                keepalive_timeout=75
+            )
+            self._session = aiohttp.ClientSession(headers=self.DEFAULT_HEADERS, connector=self._connector)
+        elif self._session.closed:
+            raise RuntimeError("YaSpeedTest client is closed")
+        return self._session
+
+    async def close(self) -> None:
+        """
+        Close the shared HTTP session and release all pooled connections.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self):
+        self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
     def __compute_peak_from_samples(
         self,
         samples: Deque[Tuple[float, int]],
@@ -134,52 +220,160 @@ class YaSpeedTest:
         # ===== Anti-artifact filter physical upper cap =====
         return min(peak, cap_mbps)
     
-    async def __start_proccess(self) -> None:
+    async def _start_process(self) -> None:
         """
         Initialize the measurement process by fetching probes from the API.
 
         This method performs a GET request to the Yandex Internet Meter endpoint
-        to retrieve available probes. It updates the session headers with any
-        headers returned by the server and stores the parsed probes data.
+        through the shared session, so the keep-alive pool is already warm
+        when the first probe runs. It stores any headers returned by the server
+        and the parsed probes data.
 
         Steps:
             1. Sends a GET request to the probes endpoint.
             2. Raises `YandexAPIError` if the request fails.
-            3. Updates the session headers with returned headers.
+            3. Stores the returned headers in `self.headers`.
             4. Parses the JSON response into a `ProbesResponse` object.
             5. Sets `self.mid` and `self.lid` based on the received probes.
         """
         url = f"{self.base_url}/internet/api/v0/get-probes"
-        timeout_config = aiohttp.ClientTimeout(total=10)
+        timeout_config = _client_timeout(10)
+        session = self._get_session()
+
+        try:
+            async with session.get(url, timeout=timeout_config) as resp:
+                if resp.status != 200:
+                    text = await resp.text()
+                    raise YandexAPIError(f"Process not started: {text}")
+                
+                # Update headers with any returned headers
+                for key, value in resp.headers.items():
+                    self.headers[key] = value
+
+                # Parse response JSON bytes directly into ProbesResponse
+                self.probes = ProbesResponse.model_validate_json(await resp.read())
+                self.mid = self.probes.mid
+                self.lid = self.probes.lid
+
+        except Exception as e:
+            raise YandexAPIError(f"Failed to start process: {e}") from e
+
+    async def _warmup_probe_hosts(self) -> None:
+        """
+        Resolve every probe hostname and open a pooled connection to it.
+
+        Sends one HEAD request per unique probe host so that the connector's DNS
+        cache and keep-alive pool are populated before measurements begin.
+        Failures are ignored: the measurement itself will report them.
+        """
+        urls = {}
+        for probe in self.probes.latency.probes + self.probes.download.probes + self.probes.upload.probes:
+            if probe.url:
+                urls.setdefault(urlsplit(probe.url).hostname, probe.url)
+
+        timeout_config = _client_timeout(5)
+        session = self._get_session()
+
+        async def warmup(url: str) -> None:
+            async with session.head(url, timeout=timeout_config, allow_redirects=False):
+                pass
+
+        await asyncio.gather(*(warmup(url) for url in urls.values()), return_exceptions=True)
+
+    async def _measure_baseline_rtts(self) -> None:
+        """
+        Measure the baseline RTT of every download and upload probe host.
+
+        Runs in `create()` right after the warmup, over the already open connections
+        and before any transfer loads the link, so one unwarmed round per host is enough.
+        """
+        urls = {}
+        for probe in self.probes.download.probes + self.probes.upload.probes:
+            if probe.url:
+                urls.setdefault(urlsplit(probe.url).netloc, probe.url)
+
+        await asyncio.gather(*(self._baseline_rtt(url, warmup=0) for url in urls.values()))
+
+    async def _baseline_rtt(self, url: str, warmup: int = 1) -> float:
+        """
+        Return the baseline round-trip time to the host of `url`, in seconds.
+
+        Measured once per host and cached. Hosts not measured by `create()` are
+        measured on first use, under a per-host lock. Returns 0 if the host cannot
+        be pinged.
+        """
+        host = urlsplit(url).netloc
+        if host in self._baseline_rtt_s:
+            return self._baseline_rtt_s[host]
+
+        async with self._baseline_locks.setdefault(host, asyncio.Lock()):
+            if host not in self._baseline_rtt_s:
+                ping_ms = await self.measure_latency(url, attempts=3, warmup=warmup)
+                self._baseline_rtt_s[host] = ping_ms / 1000 if ping_ms < 10_000 else 0.0
+            return self._baseline_rtt_s[host]
+
+    async def _adjusted_request(
+        self,
+        method: str,
+        url: str,
+        timeout_config: aiohttp.ClientTimeout,
+        reader: Callable[[aiohttp.ClientResponse], Awaitable[int]],
+        **kwargs
+    ) -> Tuple[float, int]:
+        """
+        Run `_timed_request` and remove the host's baseline RTT from the elapsed time
+        (see `_subtract_baseline`).
+        """
+        baseline = await self._baseline_rtt(url)
+        elapsed, nbytes = await self._timed_request(method, url, timeout_config, reader, **kwargs)
+        return _subtract_baseline(elapsed, baseline), nbytes
 
-        async with aiohttp.ClientSession(headers=self.DEFAULT_HEADERS, timeout=timeout_config) as session:
+    async def _timed_request(
+        self,
+        method: str,
+        url: str,
+        timeout_config: aiohttp.ClientTimeout,
+        reader: Callable[[aiohttp.ClientResponse], Awaitable[int]],
+        **kwargs
+    ) -> Tuple[float, int]:
+        """
+        Perform a request through the shared session and time it.
+
+        Parameters:
+            method (str): HTTP method.
+            url (str): Request URL.
+            timeout_config (aiohttp.ClientTimeout): Per-request timeout.
+            reader (Callable): Coroutine that consumes the response and returns the byte count.
+            **kwargs: Extra arguments passed to `ClientSession.request` (e.g. `data`).
+
+        Returns:
+            Tuple[float, int]: Elapsed seconds and transferred bytes,
+            or `(float('inf'), 0)` on any error or non-success status.
+        """
+        session = self._get_session()
+        async with self._sem:
+            t0 = time.perf_counter_ns()
             try:
-                async with session.get(url) as resp:
-                    if resp.status != 200:
-                        text = await resp.text()
-                        raise YandexAPIError(f"Process not started: {text}")
-                    
-                    # Update headers with any returned headers
-                    for key, value in resp.headers.items():
-                        self.headers[key] = value
-
-                    # Parse response JSON into ProbesResponse
-                    data = await resp.json()
-                    self.probes = ProbesResponse.model_validate(data)
-                    self.mid = self.probes.mid
-                    self.lid = self.probes.lid
-
-            except Exception as e:
-                raise YandexAPIError(f"Failed to start process: {e}") from e
+                async with session.request(
+                    method, url, timeout=timeout_config, raise_for_status=True, **kwargs
+                ) as resp:
+                    nbytes = await reader(resp)
+            except Exception:
+                return float('inf'), 0
+            t1 = time.perf_counter_ns()
+        return (t1 - t0) * 1e-9, nbytes
 
     # @deprecated("not stable enough, use measure_download_peak instead")
     async def measure_download(self, url: str, timeout: int = 10) -> Tuple[float, int]:
         """
         Download a file from the specified URL and measure the transfer performance.
 
-        This method streams the content of the URL in chunks to avoid memory spikes
-        and calculates the total number of bytes downloaded along with the total
-        elapsed time in seconds.
+        This method streams the content of the URL as whatever chunks are already
+        buffered (`iter_any`), so fast links need fewer Python iterations, and
+        calculates the total number of bytes downloaded along with the total
+        elapsed time in seconds. The response buffer is raised to 1 MB so the
+        socket is not paused every 64 KB on fast links, and compressed bodies
+        are counted as received on the wire without being decoded.
 
         Parameters:
             url (str): The URL of the file or resource to download.
@@ -187,36 +381,32 @@ class YaSpeedTest:
 
         Returns:
             Tuple[float, int]: 
-                - Elapsed time in seconds (float). Returns `float('inf')` if download fails.
+                - Elapsed time in seconds (float), minus the host's baseline round-trip
+                time for transfers spanning at least 4 RTTs. Returns `float('inf')` if download fails.
                 - Total bytes downloaded (int). Returns 0 if download fails.
         """
         if not timeout:
             timeout = 10
 
-        timeout_config = aiohttp.ClientTimeout(total=None, connect=timeout, sock_read=60)
+        async def read(resp: aiohttp.ClientResponse) -> int:
+            total_bytes = 0
+            async for chunk in resp.content.iter_any():
+                total_bytes += len(chunk)
+            return total_bytes
 
-        total_bytes = 0
-        t0 = time.perf_counter()
-        try:
-            async with aiohttp.ClientSession(headers=self.DEFAULT_HEADERS, timeout=timeout_config) as session:
-                async with session.get(url) as resp:
-                    if resp.status != 200:
-                        return float('inf'), 0
-                    async for chunk in resp.content.iter_chunked(64 * 1024):
-                        total_bytes += len(chunk)
-        except Exception:
-            return float('inf'), 0
-        t1 = time.perf_counter()
-        return t1 - t0, total_bytes
+        return await self._adjusted_request(
+            "GET", url, _client_timeout(None, timeout, 60), read,
+            read_bufsize=_DOWNLOAD_READ_BUFSIZE, auto_decompress=False
+        )
     
     # @deprecated("not stable enough, use measure_upload_peak instead")
     async def measure_upload(self, url: str, size: int, timeout: int = None) -> Tuple[float, int]:
         """
         Perform an asynchronous file upload to a given URL.
 
-        This method uploads a payload of the specified size using a streamed generator
-        to avoid allocating large buffers in memory. It measures the total time taken
-        for the upload and returns it along with the number of bytes uploaded.
+        This method uploads a zero-filled payload of the specified size. It measures
+        the total time taken for the upload and returns it along with the number of
+        bytes uploaded.
 
         Parameters:
             url (str): The endpoint to which the data will be uploaded.
@@ -226,41 +416,38 @@ class YaSpeedTest:
 
         Returns:
             Tuple[float, int]: A tuple containing:
-                - The total time taken to upload the data, in seconds.
+                - The total time taken to upload the data, in seconds, minus the host's
+                baseline round-trip time for transfers spanning at least 4 RTTs.
                 - The number of bytes successfully uploaded.
                 Returns `(float('inf'), 0)` in case of an error or failed upload.
 
         Notes:
-            - Uses a 64 KB chunked stream for efficient memory usage.
-            - The `aiohttp.ClientSession` is created per call to ensure isolated headers
-            and timeout settings.
+            - Payloads up to 8 MB are sent as a single view of a shared zero block;
+            larger ones are streamed in 8 MB views of the same block.
+            - Reuses the shared `aiohttp.ClientSession`; the timeout is applied per request.
             - This is an asynchronous method and should be awaited.
         """
         if not timeout: 
             timeout = 10
 
-        chunk = b"\0" * (64 * 1024)
-        chunks = size // len(chunk)
-        tail = size % len(chunk)
+        if size <= len(_ZERO_BUFFER):
+            payload = memoryview(_ZERO_BUFFER)[:size]
+        else:
+            chunks, tail = divmod(size, len(_ZERO_BUFFER))
 
-        async def gen():
-            for _ in range(chunks):
-                yield chunk
-            if tail:
-                yield b"\0" * tail
+            async def gen():
+                for _ in range(chunks):
+                    yield _ZERO_BUFFER
+                if tail:
+                    yield memoryview(_ZERO_BUFFER)[:tail]
 
-        timeout_config = aiohttp.ClientTimeout(total=None, connect=timeout, sock_read=120)
-        t0 = time.perf_counter()
-        async with aiohttp.ClientSession(headers=self.DEFAULT_HEADERS, timeout=timeout_config) as session:
-            try:
-                async with session.post(url, data=gen()) as r:
-                    if r.status != 200:
-                        return float('inf'), 0
-                    await r.read()
-            except Exception:
-                return float('inf'), 0
-        t1 = time.perf_counter()
-        return t1 - t0, size
+            payload = gen()
+
+        async def read(resp: aiohttp.ClientResponse) -> int:
+            await resp.read()
+            return size
+
+        return await self._adjusted_request("POST", url, _client_timeout(None, timeout, 120), read, data=payload)
     
     async def measure_latency(
         self,
@@ -273,10 +460,15 @@ class YaSpeedTest:
         Measures the actual network RTT (ping) as the median of several HEAD requests.
 
         The method is configured to measure latency as accurately as possible:
-            - uses HEAD instead of GET (there's no time to read the payload);
-            - skips the first warmup measurements (eliminates the effect of a cold TCP/TLS start);
+            - uses HEAD instead of GET (there's no time to read the payload), falling back
+            to a single-byte ranged GET (remembered per host) if the server rejects HEAD
+            with 405; the body is never downloaded if the server ignores `Range`;
+            - stops the timer as soon as the response headers arrive;
+            - sends each round of attempts concurrently over the pooled keep-alive connections;
+            - skips the first warmup rounds (eliminates the effect of a cold TCP/TLS start);
             - uses trimmed median (tail trimming), eliminating outliers;
-            - disables SSL validation to avoid inflating ping due to certificate checks;
+            - shares the pooled connections opened by `create()`, so certificate checks
+            happen once per connection rather than inflating individual pings;
             - uses the shortest possible timeouts.
 
         Parameters
@@ -288,7 +480,8 @@ class YaSpeedTest:
         `attempts` : int
             Number of ping measurement attempts (recommended 5-8).
         `warmup` : int
-            Number of first attempts to be discarded.
+            Number of initial rounds to be discarded. Each warmup round opens
+            the connections reused by the measured round.
 
         Returns
         -------
@@ -299,47 +492,52 @@ class YaSpeedTest:
         if timeout is None:
             timeout = 10  # milliseconds
 
-        timeout_config = aiohttp.ClientTimeout(
-            total=30,
-            connect=timeout,
-            sock_read=1
-        )
-
-        times = []
+        timeout_config = _client_timeout(30, timeout, 1)
+        session = self._get_session()
+        host = urlsplit(url).netloc
 
-        connector = aiohttp.TCPConnector(ssl=False)
-
-        async with aiohttp.ClientSession(
-            headers=self.DEFAULT_HEADERS,
-            timeout=timeout_config,
-            connector=connector
-        ) as session:
-
-            for i in range(attempts + warmup):
-                t0 = time.perf_counter()
+        # Attempts are timed in integer nanoseconds (up to the response headers)
+        # and converted once at the end
+        async def ping() -> int:
+            async with self._sem:
                 try:
-                    async with session.head(url) as r:
-                        await r.release()
-                    t1 = time.perf_counter()
-
-                    if i >= warmup:
-                        times.append((t1 - t0) * 1000)
+                    if host not in self._head_rejected_hosts:
+                        t0 = time.perf_counter_ns()
+                        async with session.head(url, timeout=timeout_config, allow_redirects=False) as r:
+                            t1 = time.perf_counter_ns()
+                            status = r.status
+                        if status != 405:
+                            return t1 - t0
+                        self._head_rejected_hosts.add(host)
+
+                    t0 = time.perf_counter_ns()
+                    async with session.get(
+                        url, timeout=timeout_config, allow_redirects=False, headers={"Range": "bytes=0-0"}
+                    ) as r:
+                        t1 = time.perf_counter_ns()
+                        if r.status != 206 or r.content_length is None or r.content_length > 1:
+                            # Range ignored: drop the connection instead of downloading the body
+                            r.close()
+                        else:
+                            await r.read()
                 except Exception:
-                    if i >= warmup:
-                        times.append(10_000)
+                    return 10_000_000_000
+            return t1 - t0
+
+        for _ in range(warmup):
+            await asyncio.gather(*(ping() for _ in range(attempts)))
 
-                await asyncio.sleep(0.02)
+        times = list(await asyncio.gather(*(ping() for _ in range(attempts))))
 
         if not times:
             return float("inf")
 
+        times.sort()
         if len(times) >= 5:
-            times_sorted = sorted(times)
-            k = max(1, len(times_sorted) // 5)
-            times_trimmed = times_sorted[:-k]
-            return statistics.median(times_trimmed)
+            k = max(1, len(times) // 5)
+            return _median_sorted(times[:-k]) / 1_000_000
 
-        return statistics.median(times)
+        return _median_sorted(times) / 1_000_000
     
     async def measure_download_peak(self, url: str, timeout: int = 60) -> float:
         """
@@ -372,18 +570,20 @@ class YaSpeedTest:
             throughput fluctuations, ensuring a stable peak speed metric.
         """
 
-        timeout_config = aiohttp.ClientTimeout(total=None, connect=timeout, sock_read=60)
+        timeout_config = _client_timeout(None, timeout, 60)
         samples: Deque[Tuple[float, int]] = deque(maxlen=200000)
+        session = self._get_session()
 
         try:
-            async with aiohttp.ClientSession(headers=self.DEFAULT_HEADERS, timeout=timeout_config) as session:
-                async with session.get(url) as resp:
-                    if resp.status != 200:
-                        return 0.0
-
-                    async for chunk in resp.content.iter_chunked(64 * 1024):
-                        now = time.perf_counter()
-                        samples.append((now, len(chunk)))
+            async with self._sem, session.get(
+                url, timeout=timeout_config, read_bufsize=_DOWNLOAD_READ_BUFSIZE, auto_decompress=False
+            ) as resp:
+                if resp.status != 200:
+                    return 0.0
+
+                async for chunk in resp.content.iter_chunked(64 * 1024):
+                    now = time.perf_counter()
+                    samples.append((now, len(chunk)))
         except ClientConnectorError:
             return 0.0
         except asyncio.CancelledError:
@@ -420,11 +620,10 @@ class YaSpeedTest:
             and eliminates unrealistic outliers.
         """
         
-        chunk = b"\0" * (64 * 1024)
-        chunks = size // len(chunk)
-        tail = size % len(chunk)
+        chunk = _PEAK_CHUNK
+        chunks, tail = divmod(size, len(chunk))
 
-        timeout_config = aiohttp.ClientTimeout(total=None, connect=timeout, sock_read=120)
+        timeout_config = _client_timeout(None, timeout, 120)
         samples: Deque[Tuple[float, int]] = deque(maxlen=200000)
 
         async def gen():
@@ -436,14 +635,14 @@ class YaSpeedTest:
             if tail:
                 now = time.perf_counter()
                 samples.append((now, tail))
-                yield b"\0" * tail
+                yield memoryview(chunk)[:tail]
 
+        session = self._get_session()
         try:
-            async with aiohttp.ClientSession(headers=self.DEFAULT_HEADERS, timeout=timeout_config) as session:
-                async with session.post(url, data=gen()) as resp:
-                    if resp.status != 200:
-                        return 0.0
-                    await resp.read()
+            async with self._sem, session.post(url, data=gen(), timeout=timeout_config) as resp:
+                if resp.status != 200:
+                    return 0.0
+                await resp.read()
 
         except ClientConnectorError:
             raise